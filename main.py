@@ -3,6 +3,8 @@
 # Adrián Fernando Gaitán Londoño
 
 import ui
+import os
+import json
 import time
 import threading
 from typing import Any, Iterable, Optional, List, Tuple
@@ -282,17 +284,172 @@ def linear_conflict(s: PuzzleState) -> int:
     return base + 2 * conflicts
 
 
+# Walking distance: a row configuration is the 3x3 count matrix
+# counts[row][goal_row] of tiles (blank excluded), packed 2 bits per cell.
+# The goal is symmetric under transposition, so the same table serves columns.
+WD_TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wd_table.json')
+_wd_table = None
+
+
+def _wd_key(counts):
+    key = 0
+    for k, c in enumerate(counts):
+        key |= c << (2 * k)
+    return key
+
+
+def build_wd_table():
+    """Breadth-first search over row configurations starting from the goal"""
+    counts = [0] * 9
+    for i, v in enumerate(GOAL):
+        if v != 0:
+            counts[(i // 3) * 3 + GOAL_POS[v] // 3] += 1
+    start = (tuple(counts), GOAL.index(0) // 3)
+
+    table = {_wd_key(start[0]): 0}
+    frontier = Queue()
+    frontier.enqueue(start)
+    while not frontier.is_empty():
+        counts, blank = frontier.dequeue()
+        d = table[_wd_key(counts)]
+        for nb in (blank - 1, blank + 1):
+            if not 0 <= nb < 3:
+                continue
+            for g in range(3):
+                if counts[nb * 3 + g] == 0:
+                    continue
+                nc = list(counts)
+                nc[nb * 3 + g] -= 1
+                nc[blank * 3 + g] += 1
+                key = _wd_key(nc)
+                if key not in table:
+                    table[key] = d + 1
+                    frontier.enqueue((tuple(nc), nb))
+    return table
+
+
+def load_wd_table(path=WD_TABLE_FILE):
+    """Returns the walking-distance table, building and caching it on first use"""
+    global _wd_table
+    if _wd_table is not None:
+        return _wd_table
+
+    try:
+        with open(path) as f:
+            _wd_table = {int(k): v for k, v in json.load(f).items()}
+    except (OSError, ValueError):
+        _wd_table = build_wd_table()
+        try:
+            with open(path, 'w') as f:
+                json.dump(_wd_table, f)
+        except OSError:
+            pass  # read-only location: keep the in-memory table
+    return _wd_table
+
+
+def walking_distance(s: PuzzleState) -> int:
+    """Heuristic: walking distance (row moves + column moves)"""
+    table = _wd_table if _wd_table is not None else load_wd_table()
+    row_key = 0
+    col_key = 0
+    for i, v in enumerate(s.tiles):
+        if v == 0:
+            continue
+        r, c = divmod(i, 3)
+        gr, gc = divmod(GOAL_POS[v], 3)
+        row_key += 1 << (2 * (r * 3 + gr))
+        col_key += 1 << (2 * (c * 3 + gc))
+    return table[row_key] + table[col_key]
+
+
+def max_heuristic(*heuristics):
+    """Combined heuristic: max of admissible heuristics, cheapest first.
+
+    The returned function accepts an optional limit; evaluation stops as soon
+    as one heuristic exceeds it, skipping the costlier ones.
+    """
+    def h(s, limit=inf):
+        best = 0
+        for hi in heuristics:
+            v = hi(s)
+            if v > best:
+                best = v
+                if best > limit:
+                    break
+        return best
+
+    h.lazy = True
+    return h
+
+
+wd_linear_conflict = max_heuristic(walking_distance, linear_conflict)
+
+
+def pack_tiles(tiles) -> int:
+    """Packs a tile tuple into a single int (one byte per tile)"""
+    return int.from_bytes(bytes(tiles), 'little')
+
+
+class HeuristicCache:
+    """Memoizing wrapper for a heuristic: direct-mapped table of fixed capacity.
+
+    Each packed state maps to exactly one slot; a colliding state overwrites
+    the previous entry, so memory stays bounded by capacity.
+    """
+
+    def __init__(self, h, bits=16):
+        self.h = h
+        self.capacity = 1 << bits
+        self._shift = 64 - bits
+        self._keys = [None] * self.capacity
+        self._vals = [0] * self.capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __call__(self, s: PuzzleState) -> int:
+        k = pack_tiles(s.tiles)
+        i = ((k * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> self._shift  # Fibonacci hashing
+        if self._keys[i] == k:
+            self.hits += 1
+            return self._vals[i]
+        self.misses += 1
+        if self._keys[i] is not None:
+            self.evictions += 1
+        v = self.h(s)
+        self._keys[i] = k
+        self._vals[i] = v
+        return v
+
+    def stats(self):
+        """Returns hit/miss counters for sizing the table"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "capacity": self.capacity,
+        }
+
+    def clear(self):
+        self._keys = [None] * self.capacity
+        self._vals = [0] * self.capacity
+        self.hits = self.misses = self.evictions = 0
+
+
 # ============================================================================
 # PRIORITY QUEUE for informed algorithms
 # ============================================================================
 
 class PriorityQueue:
-    def __init__(self):
+    def __init__(self, lifo=False):
         self._h = MinHeap()
         self._t = 0
+        self._step = -1 if lifo else 1
 
     def push(self, priority, item):
-        self._t += 1
+        self._t += self._step
         self._h.push((priority, self._t, item))
 
     def pop(self):
@@ -353,91 +510,72 @@ def DFS(problem: Problem, depth_limit=None):
     return None, expanded
 
 
-def UCS(problem: Problem):
-    """Uniform cost search"""
-    pq = PriorityQueue()
+def best_first_search(problem: Problem, priority, duplicates="generation", reopen=True, tie_break="fifo"):
+    """Generic best-first search
+
+    priority: function of a Node giving its priority (lower is expanded first)
+    duplicates: "generation" drops children that do not improve the best known g;
+                "expansion" keeps every child and skips expanded states when popped
+    reopen: whether an expanded state may be expanded again via a cheaper path
+    tie_break: order among equal priorities: "fifo", "lifo" or "deep" (larger g first)
+    """
+    if duplicates not in ("generation", "expansion"):
+        raise ValueError(f"unknown duplicate policy: {duplicates}")
+    if tie_break == "deep":
+        key = lambda n: (priority(n), -n.g)
+    elif tie_break in ("fifo", "lifo"):
+        key = priority
+    else:
+        raise ValueError(f"unknown tie-breaking rule: {tie_break}")
+    on_generation = duplicates == "generation"
+
+    pq = PriorityQueue(lifo=tie_break == "lifo")
     start = Node(problem.initial_state())
-    pq.push(0.0, start)
-    best = {start.state: 0.0}
+    pq.push(key(start), start)
+    best = {start.state: start.g}
+    closed = {}
     expanded = 0
 
     while not pq.is_empty():
         n = pq.pop()
+        if on_generation and n.g > best[n.state]:
+            continue  # superseded by a cheaper path pushed later
         if problem.is_goal(n.state):
             return reconstruct_path(n), expanded
+        if n.state in closed and (not reopen or n.g >= closed[n.state]):
+            continue
+        closed[n.state] = n.g
         expanded += 1
         for c in n.expand(problem):
-            if c.state not in best or c.g < best[c.state]:
+            if on_generation:
+                if c.state in best and c.g >= best[c.state]:
+                    continue
+                if not reopen and c.state in closed:
+                    continue
                 best[c.state] = c.g
-                pq.push(c.g, c)
+            pq.push(key(c), c)
 
     return None, expanded
 
 
-def Greedy(problem: Problem, h):
-    """Greedy search"""
-    pq = PriorityQueue()
-    start = Node(problem.initial_state())
-    pq.push(h(start.state), start)
-    seen = set()
-    expanded = 0
+def UCS(problem: Problem):
+    """Uniform cost search"""
+    return best_first_search(problem, lambda n: n.g)
 
-    while not pq.is_empty():
-        n = pq.pop()
-        if problem.is_goal(n.state):
-            return reconstruct_path(n), expanded
-        if n.state in seen:
-            continue
-        seen.add(n.state)
-        expanded += 1
-        for c in n.expand(problem):
-            pq.push(h(c.state), c)
 
-    return None, expanded
+def Greedy(problem: Problem, h):
+    """Greedy search"""
+    return best_first_search(problem, lambda n: h(n.state), duplicates="expansion", reopen=False)
 
 
 def A_star(problem: Problem, h):
     """A* search"""
-    pq = PriorityQueue()
-    start = Node(problem.initial_state())
-    pq.push(h(start.state) + start.g, start)
-    best = {start.state: 0.0}
-    expanded = 0
-
-    while not pq.is_empty():
-        n = pq.pop()
-        if problem.is_goal(n.state):
-            return reconstruct_path(n), expanded
-        expanded += 1
-        for c in n.expand(problem):
-            f = c.g + h(c.state)
-            if c.state not in best or c.g < best[c.state]:
-                best[c.state] = c.g
-                pq.push(f, c)
-
-    return None, expanded
+    return best_first_search(problem, lambda n: n.g + h(n.state))
 
 
 def Weighted_A_star(problem: Problem, h, w=1.5):
     """Weighted A* (extra)"""
-    pq = PriorityQueue()
-    start = Node(problem.initial_state())
-    pq.push(w * h(start.state) + start.g, start)
-    best = {start.state: 0.0}
-    expanded = 0
-
-    while not pq.is_empty():
-        n = pq.pop()
-        if problem.is_goal(n.state):
-            return reconstruct_path(n), expanded
-        expanded += 1
-        for c in n.expand(problem):
-            f = c.g + w * h(c.state)
-            if c.state not in best or c.g < best[c.state]:
-                best[c.state] = c.g
-                pq.push(f, c)
-
-    return None, expanded
+    return best_first_search(problem, lambda n: n.g + w * h(n.state))
 
 
 def IDA_star(problem: Problem, h):
@@ -445,10 +583,11 @@ def IDA_star(problem: Problem, h):
     start = Node(problem.initial_state())
     bound = h(start.state)
     expanded_total = 0
+    lazy = getattr(h, 'lazy', False)
 
     def dfs_limited(n, g, bound):
         nonlocal expanded_total
-        f = g + h(n.state)
+        f = g + (h(n.state, bound - g) if lazy else h(n.state))
         if f > bound:
             return f, None
         if problem.is_goal(n.state):
@@ -472,6 +611,84 @@ def IDA_star(problem: Problem, h):
         bound = t
 
 
+# ============================================================================
+# REAL-TIME SEARCH (LRTA* with bounded lookahead)
+# ============================================================================
+
+HINT_BUDGET_MS = 50
+
+
+class _Timeout(Exception):
+    pass
+
+
+class RealTimeSearch:
+    """LRTA*: picks the next move within a time budget and learns h across calls"""
+
+    def __init__(self, h, budget_ms=50, max_depth=12):
+        self.h = h
+        self.budget_ms = budget_ms
+        self.max_depth = max_depth
+        self.learned = {}
+
+    def estimate(self, s: State) -> float:
+        v = self.learned.get(s)
+        return self.h(s) if v is None else v
+
+    def next_move(self, problem: Problem, s: Optional[State] = None):
+        """Returns (action, next_state), or None if s is already a goal"""
+        if s is None:
+            s = problem.initial_state()
+        if problem.is_goal(s):
+            return None
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+
+        children = []
+        for a in problem.actions(s):
+            sp = problem.result(s, a)
+            children.append((a, sp, problem.step_cost(s, a, sp)))
+
+        # Depth-1 lookahead always completes, so a move is always available
+        best, choice = inf, None
+        for a, sp, c in children:
+            v = c + self.estimate(sp)
+            if v < best:
+                best, choice = v, (a, sp)
+
+        # Deepen the lookahead while the budget lasts
+        for depth in range(2, self.max_depth + 1):
+            try:
+                alpha, pick = inf, None
+                for a, sp, c in children:
+                    v = self._minimin(problem, sp, s, c, depth - 1, alpha, deadline)
+                    if v < alpha:
+                        alpha, pick = v, (a, sp)
+            except _Timeout:
+                break
+            best, choice = alpha, pick
+
+        self.learned[s] = max(self.estimate(s), best)
+        return choice
+
+    def _minimin(self, problem, s, parent, g, depth, alpha, deadline):
+        """Minimum frontier f-value below s (pathmax, alpha pruning)"""
+        if time.perf_counter() > deadline:
+            raise _Timeout
+        f = g + self.estimate(s)
+        if f >= alpha or depth == 0 or problem.is_goal(s):
+            return f
+        m = inf
+        for a in problem.actions(s):
+            sp = problem.result(s, a)
+            if sp == parent:
+                continue
+            v = self._minimin(problem, sp, s, g + problem.step_cost(s, a, sp), depth - 1, min(alpha, m), deadline)
+            if v < m:
+                m = v
+        # Learned values at interior states must not be bypassed
+        return max(f, m)
+
+
 # ============================================================================
 # GRAPHICAL INTERFACE WITH PYTHONISTA
 # ============================================================================
@@ -486,6 +703,7 @@ class PuzzleView(ui.View):
         self.solution_path = None
         self.animation_running = False
         self.animation_step = 0
+        self.hinter = None  # RealTimeSearch, kept across hints to reuse learned h
 
         self.setup_ui()
 
@@ -544,7 +762,7 @@ class PuzzleView(ui.View):
         main_view.add_subview(heur_label)
 
         self.heuristic_selector = ui.SegmentedControl()
-        self.heuristic_selector.segments = ['Manhattan', 'Misplaced', 'Linear Conflict']
+        self.heuristic_selector.segments = ['Manhattan', 'Misplaced', 'Linear Conflict', 'Walking Dist', 'Max']
         self.heuristic_selector.selected_index = 0  # Manhattan by default
         self.heuristic_selector.frame = (30, 690, 540, 40)
         main_view.add_subview(self.heuristic_selector)
@@ -556,7 +774,7 @@ class PuzzleView(ui.View):
         solve_button.tint_color = 'white'
         solve_button.corner_radius = 12
         solve_button.font = ('Arial', 18)
-        solve_button.frame = (30, 750, 120, 50)
+        solve_button.frame = (30, 750, 96, 50)
         solve_button.action = self.solve_puzzle
         main_view.add_subview(solve_button)
 
@@ -566,7 +784,7 @@ class PuzzleView(ui.View):
         shuffle_button.tint_color = 'white'
         shuffle_button.corner_radius = 12
         shuffle_button.font = ('Arial', 18)
-        shuffle_button.frame = (170, 750, 120, 50)
+        shuffle_button.frame = (141, 750, 96, 50)
         shuffle_button.action = self.shuffle_puzzle
         main_view.add_subview(shuffle_button)
 
@@ -576,7 +794,7 @@ class PuzzleView(ui.View):
         animate_button.tint_color = 'white'
         animate_button.corner_radius = 12
         animate_button.font = ('Arial', 18)
-        animate_button.frame = (310, 750, 120, 50)
+        animate_button.frame = (252, 750, 96, 50)
         animate_button.action = self.animate_solution
         main_view.add_subview(animate_button)
 
@@ -586,10 +804,20 @@ class PuzzleView(ui.View):
         reset_button.tint_color = 'white'
         reset_button.corner_radius = 12
         reset_button.font = ('Arial', 18)
-        reset_button.frame = (450, 750, 120, 50)
+        reset_button.frame = (363, 750, 96, 50)
         reset_button.action = self.reset_puzzle
         main_view.add_subview(reset_button)
 
+        hint_button = ui.Button()
+        hint_button.title = 'Hint'
+        hint_button.background_color = '#9C27B0'
+        hint_button.tint_color = 'white'
+        hint_button.corner_radius = 12
+        hint_button.font = ('Arial', 18)
+        hint_button.frame = (474, 750, 96, 50)
+        hint_button.action = self.hint_move
+        main_view.add_subview(hint_button)
+
         # Results area - Larger
         self.results_text = ui.TextView()
         self.results_text.frame = (30, 820, 540, 160)
@@ -615,7 +843,7 @@ class PuzzleView(ui.View):
 
     def get_selected_heuristic(self):
         """Returns the selected heuristic function"""
-        heuristics = [manhattan, misplaced, linear_conflict]
+        heuristics = [manhattan, misplaced, linear_conflict, walking_distance, wd_linear_conflict]
         return heuristics[self.heuristic_selector.selected_index]
 
     def solve_puzzle(self, sender):
@@ -632,6 +860,7 @@ class PuzzleView(ui.View):
         # Execute in separate thread to avoid blocking UI
         def solve_thread():
             try:
+                cache = None
                 start_time = time.time()
 
                 if algo_name == 'BFS':
@@ -643,7 +872,8 @@ class PuzzleView(ui.View):
                 elif algo_name == 'Greedy':
                     result, expanded = Greedy(problem, h)
                 elif algo_name == 'IDA*':
-                    result, expanded = IDA_star(problem, h)
+                    cache = HeuristicCache(h)
+                    result, expanded = IDA_star(problem, cache)
 
                 elapsed = time.time() - start_time
 
@@ -656,12 +886,36 @@ class PuzzleView(ui.View):
 
                     heur_name = self.heuristic_selector.segments[self.heuristic_selector.selected_index]
                     self.results_text.text = f"{algo_name} ({heur_name}):\n✅ Solución encontrada!\nPasos: {depth}\nNodos expandidos: {expanded}\nTiempo: {elapsed:.3f}s"
+                    if cache is not None:
+                        self.results_text.text += f"\nCache h: {cache.stats()['hit_rate']:.0%}"
 
             except Exception as e:
                 self.results_text.text = f"Error: {str(e)}"
 
         threading.Thread(target=solve_thread).start()
 
+    def hint_move(self, sender):
+        """Plays the next move suggested by real-time search"""
+        if self.animation_running:
+            return
+
+        h = self.get_selected_heuristic()
+        if self.hinter is None or self.hinter.h is not h:
+            self.hinter = RealTimeSearch(h, budget_ms=HINT_BUDGET_MS)
+
+        start_time = time.time()
+        move = self.hinter.next_move(Puzzle(self.current_state))
+        elapsed = time.time() - start_time
+
+        if move is None:
+            self.results_text.text = 'Puzzle already solved!'
+            return
+        action, state = move
+        self.current_state = state.tiles
+        self.update_puzzle_display()
+        self.solution_path = None
+        self.results_text.text = f"Hint: {action}\nTime: {elapsed * 1000:.1f}ms"
+
     def shuffle_puzzle(self, sender):
         """Shuffles the puzzle randomly"""
         import random